@@ -19,8 +19,16 @@ Test Factory to make fake objects for testing
 """
 import factory
 from factory.fuzzy import FuzzyChoice, FuzzyDecimal
+from faker import Faker
 from service.models import Product, Category
 
+# Seed the random generators so every run builds the same fake data, and
+# share one Faker instance instead of resolving a provider on every call
+SEED = 1234
+Faker.seed(SEED)
+factory.random.reseed_random(SEED)
+FAKE = Faker()
+
 
 class ProductFactory(factory.Factory):
     """Creates fake products for testing"""
@@ -46,7 +54,7 @@ class ProductFactory(factory.Factory):
             "Wrench"
         ]
     )
-    description = factory.Faker("text")
+    description = factory.LazyFunction(FAKE.text)
     price = FuzzyDecimal(0.5, 2000.0, 2)
     available = FuzzyChoice(choices=[True, False])
     category = FuzzyChoice(